@@ -0,0 +1,11 @@
+-- AIListHub indexes for the `tools` table (MySQL 8+)
+-- Run once against DB_NAME, e.g.: mysql -h $DB_HOST -u $DB_USER -p $DB_NAME < db_indexes.sql
+
+-- /tools reads ORDER BY updated_on DESC LIMIT 50; without this the query
+-- scans the whole table and filesorts it on every request.
+-- The index is not covering because /tools also returns description/tags/source.
+CREATE INDEX idx_tools_updated_on ON tools (updated_on DESC);
+
+-- upsert_tools relies on ON DUPLICATE KEY UPDATE, which only dedupes against
+-- a unique key. Remove any existing duplicate urls before running this.
+ALTER TABLE tools ADD UNIQUE KEY uk_tools_url (url);
@@ -10,13 +10,22 @@ AIListHub Automation Script
 
 import os
 import re
+import time
+import sqlite3
+import hashlib
 import logging
 import argparse
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from urllib.parse import urlparse, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from datetime import datetime
+from lxml import etree
 from io import BytesIO
 from dotenv import load_dotenv
 
@@ -24,6 +33,7 @@ from dotenv import load_dotenv
 
 # DB connector
 import mysql.connector
+import mysql.connector.pooling
 
 # Load env
 load_dotenv()
@@ -36,90 +46,299 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 LOGO_DIR = os.getenv("LOGO_DOWNLOAD_DIR", "./logos")
 USER_AGENT = os.getenv("USER_AGENT", "AIListHubBot/1.0")
 
-headers = {"Authorization": "7w3eo0YVckXTS5hzztYhtPFT423eJ3_ZuzLtjZnVxj0"}
-r = requests.get("https://api.producthunt.com/v2/api/graphql", headers=headers)
+# Shared HTTP session so repeat requests to the same host reuse keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers.update({"User-Agent": USER_AGENT})
 
 
 import google.generativeai as genai
-import logging
-import re
-
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-
 
-load_dotenv()
-
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-
-def generate_description_gemini(name, desc):
-    prompt = f"""Write a concise 80-120 word SEO-friendly description for the AI tool below. 
-    Use an engaging tone, mention the primary use-case, and include a 3-word tagline in parentheses.
-    
-    Tool Name: {name}
-    Description: {desc}
-    """
-
-    try:
-        model = genai.GenerativeModel("gemini-1.5-flash-latest")
-        response = model.generate_content(prompt)
-        return response.text.strip()
-    except Exception as e:
-        logging.error(f"Gemini generation failed: {e}")
-        return None
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
 
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+# Configure the SDK once at import rather than per description
+genai.configure(api_key=GEMINI_API_KEY)
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 # Ensure logo dir exists
 os.makedirs(LOGO_DIR, exist_ok=True)
 
-def get_db_connection():
+def get_db_connection(use_pure=False):
     return mysql.connector.connect(
         host=DB_HOST,
         port=DB_PORT,
         user=DB_USER,
         password=DB_PASSWORD,
         database=DB_NAME,
-        charset="utf8mb4"
+        charset="utf8mb4",
+        use_pure=use_pure,
+        autocommit=False
     )
 
+# mysql-connector caps pools at 32, below FastAPI's 40 sync worker threads, and
+# get_connection() never waits; _db_pool_slots makes requests queue for a free
+# connection and only get a 503 after DB_POOL_TIMEOUT seconds
+DB_POOL_SIZE = 32
+DB_POOL_TIMEOUT = 10
+_db_pool_slots = threading.BoundedSemaphore(DB_POOL_SIZE)
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def get_db_pool():
+    """
+    Return the connection pool used by the API, creating it on first use.
+    """
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            _db_pool = mysql.connector.pooling.MySQLConnectionPool(
+                pool_name="listhub",
+                pool_size=DB_POOL_SIZE,
+                host=DB_HOST,
+                port=DB_PORT,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                database=DB_NAME,
+                charset="utf8mb4",
+                use_pure=False
+            )
+    return _db_pool
+
+_db_conn = None
+
+def get_shared_db_connection():
+    """
+    Return the process-wide DB connection, reconnecting if it has dropped
+    (e.g. wait_timeout while descriptions were being generated).
+    """
+    global _db_conn
+    if _db_conn is None or not _db_conn.is_connected():
+        _db_conn = get_db_connection()
+    return _db_conn
+
+def close_shared_db_connection():
+    global _db_conn
+    if _db_conn is not None:
+        _db_conn.close()
+        _db_conn = None
+
+@dataclass(slots=True)
+class Candidate:
+    """
+    A tool scraped from a source; process_candidate fills in the description.
+    """
+    name: str = ""
+    url: str = ""
+    category: str = ""
+    description: str = ""
+    logo: str = ""
+    source: str = "unknown"
+    tags: str = ""
+    short: str = ""
+
+def canonical_url(url: str):
+    """
+    Dedupe key for a URL, ignoring scheme, case, "www." and trailing slashes.
+    """
+    p = urlparse(url.lower().strip())
+    return (p.netloc.removeprefix("www."), p.path.rstrip("/"), p.query)
+
+def url_variants(key: tuple) -> list:
+    """
+    Every URL spelling that canonical_url() maps to the given key.
+    """
+    netloc, path, query = key
+    suffix = f"?{query}" if query else ""
+    return [
+        f"{scheme}://{www}{netloc}{path}{slash}{suffix}"
+        for scheme in ("https", "http")
+        for www in ("", "www.")
+        for slash in ("", "/")
+    ]
+
+_SLUG_NONALNUM = re.compile(r'[^a-z0-9]+')
+_SLUG_DASHES = re.compile(r'-+')
+_NEWLINES = re.compile(r'\n+')
+
 def slugify(s: str):
     s = s.lower().strip()
-    s = re.sub(r'[^a-z0-9]+', '-', s)
-    s = re.sub(r'-+', '-', s).strip('-')
+    s = _SLUG_NONALNUM.sub('-', s)
+    s = _SLUG_DASHES.sub('-', s).strip('-')
     return s
 
-def generate_description_gemini(name: str, category: str, url: str) -> str:
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    if not GEMINI_API_KEY:
-        logging.warning("Gemini API key not found - skipping description generation")
-        return ""
+GEMINI_MODEL_NAME = "gemini-1.5-flash"
+DESC_CACHE_PATH = os.getenv("DESC_CACHE_PATH", os.path.join(LOGO_DIR, "gemcache.sqlite3"))
+DESC_CACHE_TTL = 30 * 86400  # seconds
+# Lookups that reach the SQLite tiers; lru_cache hits come from _cached_description.cache_info()
+DESC_CACHE_STATS = {"hit": 0, "semantic_hit": 0, "miss": 0}
+_desc_cache_conn = None
+_desc_cache_lock = threading.Lock()
+
+# Optional near-duplicate tier: enable with SEMANTIC_CACHE=1 and sentence-transformers installed
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE", "0") == "1" and SentenceTransformer is not None
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+_embedder = None
+_embedder_lock = threading.Lock()
+
+def _desc_cache():
+    """
+    Lazily open the SQLite cache of generated descriptions.
+    """
+    global _desc_cache_conn
+    if _desc_cache_conn is None:
+        _desc_cache_conn = sqlite3.connect(DESC_CACHE_PATH, check_same_thread=False)
+        _desc_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions "
+            "(key TEXT PRIMARY KEY, text TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        _desc_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, name TEXT NOT NULL, vector BLOB NOT NULL, "
+            "text TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+    return _desc_cache_conn
+
+def _desc_cache_key(name: str, category: str, url: str) -> str:
+    return hashlib.sha256(f"{name}|{category}|{url}|{GEMINI_MODEL_NAME}".encode("utf-8")).hexdigest()
+
+def _desc_cache_get(key: str):
+    with _desc_cache_lock:
+        row = _desc_cache().execute(
+            "SELECT text FROM descriptions WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+    return row[0] if row else None
+
+def _desc_cache_set(key: str, text: str):
+    with _desc_cache_lock:
+        conn = _desc_cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO descriptions (key, text, expires_at) VALUES (?, ?, ?)",
+            (key, text, time.time() + DESC_CACHE_TTL)
+        )
+        conn.commit()
 
-    try:
-        genai.configure(api_key=GEMINI_API_KEY)
+def _embed(name: str, category: str):
+    global _embedder
+    with _embedder_lock:
+        if _embedder is None:
+            _embedder = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+    vec = _embedder.encode(f"{name} {category}", normalize_embeddings=True)
+    return np.asarray(vec, dtype=np.float32)
 
-        prompt = f"""Write a concise 80-120 word SEO-friendly description for the AI tool below. 
+def _semantic_cache_get(name: str, vec):
+    """
+    Return the description of the most similar cached tool, or None when
+    nothing clears SEMANTIC_CACHE_THRESHOLD (cosine similarity to vec).
+    """
+    with _desc_cache_lock:
+        rows = _desc_cache().execute(
+            "SELECT name, vector, text FROM embeddings WHERE expires_at > ?", (time.time(),)
+        ).fetchall()
+    # Vectors stored under a different embedding model have another size; skip them
+    rows = [row for row in rows if len(row[1]) == vec.nbytes]
+    if not rows:
+        return None
+    matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32).reshape(len(rows), -1)
+    scores = matrix @ vec
+    best = int(scores.argmax())
+    if scores[best] < SEMANTIC_CACHE_THRESHOLD:
+        return None
+    cached_name, _, text = rows[best]
+    if not cached_name:
+        return text
+    # Point the reused copy at the new tool, swapping whole-word mentions only
+    return re.sub(rf"(?<!\w){re.escape(cached_name)}(?!\w)", lambda _: name, text)
+
+def _semantic_cache_set(key: str, name: str, vec, text: str):
+    with _desc_cache_lock:
+        conn = _desc_cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO embeddings (key, name, vector, text, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (key, name, vec.tobytes(), text, time.time() + DESC_CACHE_TTL)
+        )
+        conn.commit()
+
+# Shared instruction prefix; only the per-tool tail varies between calls
+_PROMPT_PREFIX = """Write a concise 80-120 word SEO-friendly description for the AI tool described by the user.
 Use an engaging tone, mention the primary use-case, and include a suggested 3-word tagline at the end in parentheses.
-Tool name: {name}
-Category: {category}
-URL: {url}
 Keep it human-readable and avoid marketing fluff."""
 
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        response = model.generate_content(prompt)
+# Bound decode length and tail latency; 256 tokens comfortably fits 120 words
+GEMINI_GENERATION_CONFIG = genai.types.GenerationConfig(
+    max_output_tokens=256,
+    temperature=0.3,
+    top_p=0.9
+)
+GEMINI_REQUEST_OPTIONS = {"timeout": 20}
+
+# Building the model does no network I/O, so it is safe at import time
+_GEMINI_MODEL = genai.GenerativeModel(GEMINI_MODEL_NAME, system_instruction=_PROMPT_PREFIX)
+
+def _generate_description_uncached(name: str, category: str, url: str) -> str:
+    response = _GEMINI_MODEL.generate_content(
+        f"Tool name: {name}\nCategory: {category}\nURL: {url}",
+        generation_config=GEMINI_GENERATION_CONFIG,
+        request_options=GEMINI_REQUEST_OPTIONS
+    )
 
-        text = response.text.strip()
-        text = re.sub(r'\n+', '\n', text)
+    text = response.text.strip()
+    text = _NEWLINES.sub('\n', text)
+    return text
+
+@functools.lru_cache(maxsize=1024)
+def _cached_description(name: str, category: str, url: str) -> str:
+    # Failures raise, so neither the lru_cache nor the SQLite cache stores them
+    key = _desc_cache_key(name, category, url)
+    text = _desc_cache_get(key)
+    stat = "hit"
+    vec = None
+    if text is None and SEMANTIC_CACHE_ENABLED:
+        try:
+            # Embedding is the expensive step; reuse this vector for the store below
+            vec = _embed(name, category)
+            text = _semantic_cache_get(name, vec)
+        except Exception as e:
+            # The optional tier must never block generation
+            logging.exception("Semantic cache lookup failed: %s", e)
+        stat = "semantic_hit"
+    with _desc_cache_lock:
+        DESC_CACHE_STATS[stat if text is not None else "miss"] += 1
+    if text is not None:
         return text
 
+    text = _generate_description_uncached(name, category, url)
+    if text:
+        _desc_cache_set(key, text)
+        if vec is not None:
+            try:
+                _semantic_cache_set(key, name, vec, text)
+            except Exception as e:
+                logging.exception("Semantic cache store failed: %s", e)
+    return text
+
+def generate_description_gemini(name: str, category: str, url: str) -> str:
+    if not GEMINI_API_KEY:
+        logging.warning("Gemini API key not found - skipping description generation")
+        return ""
+
+    try:
+        return _cached_description(name, category, url)
     except Exception as e:
         logging.exception("Gemini generation failed: %s", e)
         return ""
 
-def upsert_tool(record: dict, dry_run=False):
-    UPSERT_SQL = """
+UPSERT_SQL = """
 INSERT INTO tools (name, url, category, description, logo_url, tags, source)
 VALUES (%s, %s, %s, %s, %s, %s, %s)
 ON DUPLICATE KEY UPDATE
@@ -131,40 +350,75 @@ ON DUPLICATE KEY UPDATE
     source=VALUES(source),
     updated_on=NOW();
 """
+
+# 7 placeholders per row; stays well under MySQL's 65535 parameter limit
+UPSERT_BATCH_SIZE = 1000
+
+def upsert_tools(records: list[Candidate], dry_run=False):
+    """
+    Upsert all records using executemany on the shared connection, committed once.
+    """
+    if not records:
+        return True
     if dry_run:
-        logging.info("[dry-run] Upsert: %s", record)
+        for record in records:
+            logging.info("[dry-run] Upsert: %s", record)
         return True
-    conn = get_db_connection()
+    rows = [(r.name, r.url, r.category, r.description, r.logo, r.tags, r.source) for r in records]
+    conn = None
     try:
+        conn = get_shared_db_connection()
+        conn.start_transaction()
         cur = conn.cursor()
-        cur.execute(UPSERT_SQL, (
-            record.get("name"),
-            record.get("url"),
-            record.get("category"),
-            record.get("description"),
-            record.get("logo_url"),
-            record.get("tags"),
-            record.get("source")
-        ))
+        try:
+            for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+                cur.executemany(UPSERT_SQL, rows[i:i + UPSERT_BATCH_SIZE])
+        finally:
+            cur.close()
         conn.commit()
-        cur.close()
         return True
     except Exception as e:
         logging.exception("DB upsert failed: %s", e)
+        if conn is not None:
+            try:
+                conn.rollback()
+            except Exception as rollback_err:
+                logging.error("DB rollback failed: %s", rollback_err)
         return False
-    finally:
-        conn.close()
+
+def fetch_existing_descriptions(urls: list) -> dict:
+    """
+    Map canonical_url() key -> stored description for tools already in the DB,
+    in one query that also matches other spellings of the same URL.
+    """
+    if not urls:
+        return {}
+    lookup = sorted({v for url in urls for v in url_variants(canonical_url(url))})
+    placeholders = ", ".join(["%s"] * len(lookup))
+    try:
+        conn = get_shared_db_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(f"SELECT url, description FROM tools WHERE url IN ({placeholders})", lookup)
+            return {canonical_url(url): desc for url, desc in cur.fetchall() if desc}
+        finally:
+            cur.close()
+            # autocommit is off, so end the implicit read transaction rather than
+            # holding its read view and metadata lock on tools until the upsert
+            conn.rollback()
+    except Exception as e:
+        logging.exception("Existing description lookup failed: %s", e)
+        return {}
 
 def fetch_from_github_trending(language='python', since='daily', max_items=10):
     """
     Fetch trending GitHub repos using updated HTML selectors.
     """
     url = f"https://github.com/trending/{language}?since={since}"
-    headers = {"User-Agent": USER_AGENT}
     try:
-        r = requests.get(url, headers=headers, timeout=15)
+        r = SESSION.get(url, timeout=15)
         r.raise_for_status()
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = BeautifulSoup(r.content, "lxml")
         repos = soup.find_all("article", class_="Box-row")[:max_items]
 
         results = []
@@ -181,14 +435,13 @@ def fetch_from_github_trending(language='python', since='daily', max_items=10):
             description_tag = repo.find("p")
             desc = description_tag.get_text(strip=True) if description_tag else ""
 
-            results.append({
-                "name": name,
-                "url": link,
-                "category": "Open-source",
-                "logo": "",
-                "source": "github_trending",
-                "short": desc
-            })
+            results.append(Candidate(
+                name=name,
+                url=link,
+                category="Open-source",
+                source="github_trending",
+                short=desc
+            ))
         return results
 
     except Exception as e:
@@ -204,24 +457,25 @@ def fetch_from_rss(feed_url, max_items=10):
                       "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
     }
     try:
-        r = requests.get(feed_url, headers=headers, timeout=15)
+        r = SESSION.get(feed_url, headers=headers, timeout=15)
         r.raise_for_status()
-        soup = BeautifulSoup(r.content, "xml")
-        items = soup.find_all("item")[:max_items]
 
+        # Stream items so parsing stops once max_items are collected; "{*}" also
+        # matches namespaced RSS 1.0/RDF items and recover tolerates bad entities
         results = []
-        for item in items:
-            title = item.title.get_text() if item.title else ""
-            link = item.link.get_text() if item.link else ""
-            desc = item.description.get_text() if item.description else ""
-            results.append({
-                "name": title,
-                "url": link,
-                "category": "Unknown",
-                "logo": "",
-                "source": feed_url,
-                "short": desc
-            })
+        for _, item in etree.iterparse(BytesIO(r.content), tag="{*}item", recover=True):
+            results.append(Candidate(
+                name=item.findtext("{*}title") or "",
+                url=item.findtext("{*}link") or "",
+                category="Unknown",
+                source=feed_url,
+                short=item.findtext("{*}description") or ""
+            ))
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+            if len(results) >= max_items:
+                break
         return results
 
     except requests.exceptions.HTTPError as http_err:
@@ -231,29 +485,21 @@ def fetch_from_rss(feed_url, max_items=10):
         logging.exception("RSS fetch failed: %s", e)
         return []
 
+RSS_FEEDS = [
+    "https://www.producthunt.com/feed",
+]
+FETCH_WORKERS = 8
+DESC_WORKERS = 10
 
-def process_candidate(cand: dict, generate_desc=True, dry_run=False):
-    name = cand.get("name") or ""
-    url = cand.get("url") or ""
-    category = cand.get("category") or cand.get("short") or "Misc"
-    logo = cand.get("logo") or ""
-    source = cand.get("source") or "unknown"
-    tags = cand.get("tags") or ""
-    description = cand.get("description") or ""
+def process_candidate(cand: Candidate, generate_desc=True) -> Candidate:
+    category = cand.category or cand.short or "Misc"
+    description = cand.description
 
     if not description and generate_desc:
-        description = generate_description_gemini(name, category, url)
-
-    record = {
-        "name": name,
-        "url": url,
-        "category": category,
-        "description": description,
-        "logo_url": logo,
-        "tags": tags,
-        "source": source
-    }
-    return upsert_tool(record, dry_run=dry_run)
+        description = generate_description_gemini(cand.name, category, cand.url)
+
+    return replace(cand, category=category, description=description,
+                   source=cand.source or "unknown")
 
 def main(argv=None):
     parser = argparse.ArgumentParser(description="AIListHub automation runner")
@@ -264,11 +510,18 @@ def main(argv=None):
     dry_run = args.dry_run
     generate_desc = not args.no_desc
 
-    gh_items = fetch_from_github_trending(language='python', since='daily', max_items=5)
-    logging.info("Fetched %d GitHub trending items", len(gh_items))
+    # Sources are I/O-bound, so fetch them concurrently over the shared SESSION pool
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        gh_future = ex.submit(fetch_from_github_trending, 'python', 'daily', 5)
+        rss_futures = [ex.submit(fetch_from_rss, feed_url, 5) for feed_url in RSS_FEEDS]
 
-    rss_items = fetch_from_rss("https://www.producthunt.com/feed", max_items=5)
-    logging.info("Fetched %d RSS items", len(rss_items))
+        gh_items = gh_future.result()
+        logging.info("Fetched %d GitHub trending items", len(gh_items))
+
+        rss_items = []
+        for future in rss_futures:
+            rss_items.extend(future.result())
+        logging.info("Fetched %d RSS items", len(rss_items))
 
     candidates = []
     for lst in (gh_items, rss_items):
@@ -277,36 +530,175 @@ def main(argv=None):
     seen = set()
     final = []
     for c in candidates:
-        url = c.get("url", "").strip()
-        if not url:
+        c.url = c.url.strip()
+        if not c.url:
             continue
-        if url in seen:
+        key = canonical_url(c.url)
+        if key in seen:
             continue
-        seen.add(url)
+        seen.add(key)
         final.append(c)
 
     logging.info("Processing %d unique candidates", len(final))
 
-    for cand in final:
-        ok = process_candidate(cand, generate_desc=generate_desc, dry_run=dry_run)
-        if ok:
-            logging.info("Processed: %s", cand.get("name"))
+    if generate_desc:
+        # Reuse descriptions already stored for these URLs instead of regenerating them
+        existing = fetch_existing_descriptions([c.url for c in final])
+        reused = 0
+        for c in final:
+            stored = existing.get(canonical_url(c.url))
+            if not c.description and stored:
+                c.description = stored
+                reused += 1
+        logging.info("Reusing %d stored descriptions", reused)
+
+    # Description generation is network-bound, so overlap the Gemini calls
+    with ThreadPoolExecutor(max_workers=DESC_WORKERS) as ex:
+        records = list(ex.map(
+            functools.partial(process_candidate, generate_desc=generate_desc), final
+        ))
+
+    logging.info("Description cache: %d in-process hits, %d hits, %d semantic hits, %d misses",
+                 _cached_description.cache_info().hits, DESC_CACHE_STATS["hit"],
+                 DESC_CACHE_STATS["semantic_hit"], DESC_CACHE_STATS["miss"])
+
+    try:
+        if upsert_tools(records, dry_run=dry_run):
+            for record in records:
+                logging.info("Processed: %s", record.name)
+            logging.info("Upserted %d records", len(records))
+    finally:
+        close_shared_db_connection()
 
 if __name__ == "__main__":
     main()
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
 app = FastAPI()
 
+# MySQL builds the JSON array itself, so rows never become Python dicts.
+# The window ORDER BY keeps the array newest-first.
+LIST_TOOLS_SQL = """
+SELECT JSON_ARRAYAGG(JSON_OBJECT(
+    'id', id,
+    'name', name,
+    'url', url,
+    'category', category,
+    'description', description,
+    'logo_url', logo_url,
+    'tags', tags,
+    'source', source,
+    'updated_on', DATE_FORMAT(updated_on, '%Y-%m-%dT%H:%i:%s')
+)) OVER (ORDER BY updated_on DESC, id DESC ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING)
+FROM (
+    SELECT id, name, url, category, description, logo_url, tags, source, updated_on
+    FROM tools ORDER BY updated_on DESC LIMIT 50
+) t
+LIMIT 1
+"""
+
 @app.get("/tools")
 def list_tools():
-    conn = get_db_connection()
-    cur = conn.cursor(dictionary=True)
-    cur.execute("SELECT * FROM tools ORDER BY updated_on DESC LIMIT 50")
-    data = cur.fetchall()
-    cur.close()
-    conn.close()
-    return data
+    if not _db_pool_slots.acquire(timeout=DB_POOL_TIMEOUT):
+        raise HTTPException(status_code=503, detail="Database busy, retry shortly")
+    try:
+        conn = get_db_pool().get_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute(LIST_TOOLS_SQL)
+            row = cur.fetchone()
+            cur.close()
+            return Response(content=row[0] if row else "[]", media_type="application/json")
+        finally:
+            # Returns the connection to the pool rather than closing it
+            conn.close()
+    finally:
+        _db_pool_slots.release()
+
+EXPORT_TOOLS_SQL = """
+SELECT JSON_OBJECT(
+    'id', id,
+    'name', name,
+    'url', url,
+    'category', category,
+    'description', description,
+    'logo_url', logo_url,
+    'tags', tags,
+    'source', source,
+    'updated_on', DATE_FORMAT(updated_on, '%Y-%m-%dT%H:%i:%s')
+)
+FROM tools ORDER BY updated_on DESC
+"""
+EXPORT_FETCH_SIZE = 1000
+# Exports use their own connections, outside the /tools pool; cap how many run at once
+EXPORT_MAX_CONCURRENT = 4
+_export_slots = threading.BoundedSemaphore(EXPORT_MAX_CONCURRENT)
+
+def _stream_tools_ndjson():
+    """
+    Yield every tool as one JSON line, reading EXPORT_FETCH_SIZE rows at a
+    time from an unbuffered cursor so memory stays at one chunk.
+    """
+    conn = None
+    finished = False
+    try:
+        # Pure-Python driver so an abandoned stream can drop its socket via shutdown()
+        conn = get_db_connection(use_pure=True)
+        cur = conn.cursor(buffered=False)
+        try:
+            cur.execute(EXPORT_TOOLS_SQL)
+            while True:
+                rows = cur.fetchmany(EXPORT_FETCH_SIZE)
+                if not rows:
+                    break
+                yield "".join(f"{row[0]}\n" for row in rows)
+            finished = True
+        finally:
+            if finished:
+                cur.close()
+    finally:
+        if conn is not None:
+            if finished:
+                conn.close()
+            else:
+                # Stopped early (e.g. client disconnected): close the socket
+                # instead of reading the rest of the table
+                conn.shutdown()
+
+class _ExportStream:
+    """
+    Iterator over _stream_tools_ndjson() that owns an export slot and gives it
+    back exactly once, on close or garbage collection, even if the response
+    body is never iterated (a never-started generator skips its finally).
+    """
+
+    def __init__(self):
+        self._gen = _stream_tools_ndjson()
+        self._released = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._gen)
+
+    def close(self):
+        try:
+            self._gen.close()
+        finally:
+            if not self._released:
+                self._released = True
+                _export_slots.release()
+
+    def __del__(self):
+        self.close()
+
+@app.get("/tools/export")
+def export_tools():
+    if not _export_slots.acquire(blocking=False):
+        raise HTTPException(status_code=503, detail="Too many exports running, retry shortly")
+    return StreamingResponse(_ExportStream(), media_type="application/x-ndjson")
 
 if __name__ == "__main__":
     import uvicorn
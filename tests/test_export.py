@@ -0,0 +1,84 @@
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import main
+
+
+class FakeCursor:
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def execute(self, query):
+        pass
+
+    def fetchmany(self, size):
+        return self._chunks.pop(0) if self._chunks else []
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+        self.shut_down = False
+
+    def cursor(self, buffered=True):
+        return FakeCursor(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+    def shutdown(self):
+        self.shut_down = True
+
+
+def free_slots():
+    return main._export_slots._value
+
+
+def test_export_slot_released_when_response_dropped_unread(monkeypatch):
+    monkeypatch.setattr(main, "get_db_connection", lambda use_pure=False: FakeConnection([]))
+    before = free_slots()
+
+    response = main.export_tools()
+    assert free_slots() == before - 1
+
+    del response
+    gc.collect()
+    assert free_slots() == before
+
+
+def test_export_streams_rows_and_releases_slot_once(monkeypatch):
+    conn = FakeConnection([[('{"id": 1}',), ('{"id": 2}',)], [('{"id": 3}',)]])
+    monkeypatch.setattr(main, "get_db_connection", lambda use_pure=False: conn)
+    before = free_slots()
+
+    assert main._export_slots.acquire(blocking=False)
+    stream = main._ExportStream()
+    assert "".join(stream) == '{"id": 1}\n{"id": 2}\n{"id": 3}\n'
+    stream.close()
+    del stream
+    gc.collect()
+
+    assert conn.closed and not conn.shut_down
+    assert free_slots() == before
+
+
+def test_export_abandoned_midway_shuts_down_connection(monkeypatch):
+    conn = FakeConnection([[('{"id": 1}',)], [('{"id": 2}',)]])
+    monkeypatch.setattr(main, "get_db_connection", lambda use_pure=False: conn)
+    before = free_slots()
+
+    assert main._export_slots.acquire(blocking=False)
+    stream = main._ExportStream()
+    assert next(stream) == '{"id": 1}\n'
+    del stream
+    gc.collect()
+
+    assert conn.shut_down and not conn.closed
+    assert free_slots() == before